@@ -18,8 +18,11 @@ Regular dictionaries can be used instead of SON objects, but not when the order
 of keys is important. A SON object can be used just like a normal Python
 dictionary."""
 
+import collections
 import copy
 
+_ATOMIC_TYPES = (type(None), bool, int, float, str, bytes)
+
 
 class SON(dict):
     """SON data.
@@ -66,52 +69,25 @@ class SON(dict):
        should always use UTC.
     """
 
+    # SON stores no state of its own, so let instances share dict's
+    # compact C layout instead of carrying a per-instance __dict__.
+    # Keeping __setitem__/__delitem__/__contains__ unoverridden means
+    # the hot paths run entirely at C speed; a separate compiled SON
+    # type would just reimplement dict.
+    __slots__ = ()
+
     def __init__(self, data=None, **kwargs):
-        self.__keys = []
         dict.__init__(self)
         self.update(data)
         self.update(kwargs)
 
     def __repr__(self):
-        result = []
-        for key in self.__keys:
-            result.append("(%r, %r)" % (key, self[key]))
-        return "SON([%s])" % ", ".join(result)
-
-    def __setitem__(self, key, value):
-        if key not in self.__keys:
-            self.__keys.append(key)
-        dict.__setitem__(self, key, value)
-
-    def __delitem__(self, key):
-        self.__keys.remove(key)
-        dict.__delitem__(self, key)
-
-    def keys(self):
-        for k in self.__keys:
-            yield k
+        return "SON([%s])" % ", ".join(["(%r, %r)" % (key, value)
+                                        for key, value in dict.items(self)])
 
     def copy(self):
         return SON(self)
 
-    def __iter__(self):
-        return self.keys()
-
-    def __contains__(self, key):
-        return key in self.__keys
-
-    def items(self):
-        for k in self.__keys:
-            yield (k, self[k])
-
-    def values(self):
-        for k in self.__keys:
-            yield self[k]
-
-    def clear(self):
-        dict.clear(self)
-        self.__keys = list()
-
     def setdefault(self, key, default=None):
         try:
             return self[key]
@@ -132,18 +108,12 @@ class SON(dict):
         del self[key]
         return value
 
-    def popitem(self):
-        try:
-            k, v = self.items().next()
-        except StopIteration:
-            raise KeyError('container is empty')
-        del self[k]
-        return (k, v)
-
     def update(self, other=None, **kwargs):
         # Make progressively weaker assumptions about "other"
         if other is None:
             pass
+        elif isinstance(other, dict):
+            dict.update(self, other)
         elif hasattr(other, 'items'):
             for k, v in other.items():
                 self[k] = v
@@ -154,7 +124,7 @@ class SON(dict):
             for k, v in other:
                 self[k] = v
         if kwargs:
-            self.update(kwargs)
+            dict.update(self, kwargs)
 
     def get(self, key, default=None):
         try:
@@ -162,30 +132,43 @@ class SON(dict):
         except KeyError:
             return default
 
-    def __len__(self):
-        return len(self.__keys)
-
     def to_dict(self):
         """Convert a SON document to a normal Python dictionary instance.
 
         This is trickier than just *dict(...)* because it needs to be
         recursive.
         """
-
-        def transform_value(value):
-            if isinstance(value, list):
-                return [transform_value(v) for v in value]
-            if isinstance(value, SON):
-                value = dict(value)
-            if isinstance(value, dict):
-                for k, v in value.items():
-                    value[k] = transform_value(v)
-            return value
-
-        return transform_value(dict(self))
+        out = dict(self)
+        pending = collections.deque([out])
+        while pending:
+            container = pending.pop()
+            if isinstance(container, dict):
+                for key in container:
+                    value = container[key]
+                    if isinstance(value, dict):
+                        value = container[key] = dict(value)
+                        pending.append(value)
+                    elif isinstance(value, list):
+                        value = container[key] = list(value)
+                        pending.append(value)
+            else:
+                for index, value in enumerate(container):
+                    if isinstance(value, dict):
+                        value = container[index] = dict(value)
+                        pending.append(value)
+                    elif isinstance(value, list):
+                        value = container[index] = list(value)
+                        pending.append(value)
+        return out
 
     def __deepcopy__(self, memo):
         out = SON()
+        memo[id(self)] = out
         for k, v in self.items():
-            out[k] = copy.deepcopy(v, memo)
+            # deepcopy returns atomic values unchanged; skip its
+            # dispatch machinery for them.
+            if isinstance(v, _ATOMIC_TYPES):
+                out[k] = v
+            else:
+                out[k] = copy.deepcopy(v, memo)
         return out
@@ -26,38 +26,11 @@ SCHEME = 'mongodb://'
 SCHEME_LEN = len(SCHEME)
 DEFAULT_PORT = 27017
 
-
-def _partition(entity, sep):
-    """Python2.4 doesn't have a partition method so we provide
-    our own that mimics str.partition from later releases.
-
-    Split the string at the first occurrence of sep, and return a
-    3-tuple containing the part before the separator, the separator
-    itself, and the part after the separator. If the separator is not
-    found, return a 3-tuple containing the string itself, followed
-    by two empty strings.
-    """
-    parts = entity.split(sep, 1)
-    if len(parts) == 2:
-        return parts[0], sep, parts[1]
-    else:
-        return entity, '', ''
-
-
-def _rpartition(entity, sep):
-    """Python2.4 doesn't have an rpartition method so we provide
-    our own that mimics str.rpartition from later releases.
-
-    Split the string at the last occurrence of sep, and return a
-    3-tuple containing the part before the separator, the separator
-    itself, and the part after the separator. If the separator is not
-    found, return a 3-tuple containing two empty strings, followed
-    by the string itself.
-    """
-    idx = entity.rfind(sep)
-    if idx == -1:
-        return '', '', entity
-    return entity[:idx], sep, entity[idx + 1:]
+# Combined lookup built once at import: maps each known option name
+# (already lowercase) to its validator, or to None if the option is
+# recognized but unsupported. One dict probe classifies an option.
+_OPTIONS = dict.fromkeys(UNSUPPORTED)
+_OPTIONS.update(VALIDATORS)
 
 
 def parse_userinfo(userinfo):
@@ -74,7 +47,7 @@ def parse_userinfo(userinfo):
     if '@' in userinfo or userinfo.count(':') > 1:
         raise InvalidURI("':' or '@' characters in a username or password "
                          "must be escaped according to RFC 2396.")
-    user, _, passwd = _partition(userinfo, ":")
+    user, _, passwd = userinfo.partition(":")
     if not user or not passwd:
         raise InvalidURI("An empty string is not a "
                          "valid username or password.")
@@ -122,17 +95,21 @@ def parse_host(entity, default_port=DEFAULT_PORT):
     port = default_port
     if entity[0] == '[':
         host, port = parse_ipv6_literal_host(entity, default_port)
-    elif entity.find(':') != -1:
-        if entity.count(':') > 1:
-            raise ConfigurationError("Reserved characters such as ':' must be "
-                                     "escaped according RFC 2396. An IPv6 "
-                                     "address literal must be enclosed in '[' "
-                                     "and ']' according to RFC 2732.")
-        host, port = host.split(':', 1)
+    else:
+        head, sep, tail = entity.rpartition(':')
+        if sep:
+            if ':' in head:
+                raise ConfigurationError("Reserved characters such as ':' "
+                                         "must be escaped according RFC 2396. "
+                                         "An IPv6 address literal must be "
+                                         "enclosed in '[' and ']' according "
+                                         "to RFC 2732.")
+            host, port = head, tail
     if isinstance(port, str):
-        if not port.isdigit():
+        try:
+            port = int(port)
+        except ValueError:
             raise ConfigurationError("Port number must be an integer.")
-        port = int(port)
     return host, port
 
 def validate_options(opts):
@@ -145,14 +122,17 @@ def validate_options(opts):
     """
     normalized = {}
     for key, value in opts.items():
-        opt = key.lower()
-        validate = VALIDATORS.get(opt)
-        if not validate:
-            if opt in UNSUPPORTED:
-                raise UnsupportedOption("%s is not currently "
-                                        "supported by pymongo." % (key,))
+        # Keys coming from split_options are already lowercase; only
+        # pay for .lower() when the raw key misses the table.
+        opt = key if key in _OPTIONS else key.lower()
+        try:
+            validate = _OPTIONS[opt]
+        except KeyError:
             raise ConfigurationError("%s is not a "
                                      "recognized MongoDB URI option." % (key,))
+        if validate is None:
+            raise UnsupportedOption("%s is not currently "
+                                    "supported by pymongo." % (key,))
         normalized[opt] = validate(key, value)
     return normalized
 
@@ -165,19 +145,20 @@ def split_options(opts):
     :Parameters:
         - `opt`: A string representing MongoDB URI options.
     """
-    and_idx = opts.find("&")
-    semi_idx = opts.find(";")
-    try:
-        if and_idx >= 0 and semi_idx >= 0:
+    if "&" in opts:
+        if ";" in opts:
             raise InvalidURI("Can not mix '&' and ';' for option separators.")
-        elif and_idx >= 0:
-            options = dict([kv.split("=") for kv in opts.split("&")])
-        elif semi_idx >= 0:
-            options = dict([kv.split("=") for kv in opts.split(";")])
-        elif opts.find("=") != -1:
-            options = dict([opts.split("=")])
-        else:
-            raise ValueError
+        sep = "&"
+    elif ";" in opts:
+        sep = ";"
+    elif "=" in opts:
+        # A single key=value pair; splitting on "&" is a no-op.
+        sep = "&"
+    else:
+        raise InvalidURI("MongoDB URI options are key=value pairs.")
+    try:
+        options = dict((key.lower(), value) for key, value in
+                       (kv.split("=", 1) for kv in opts.split(sep)))
     except ValueError:
         raise InvalidURI("MongoDB URI options are key=value pairs.")
 
@@ -225,15 +206,32 @@ def parse_uri(uri, default_port=DEFAULT_PORT):
         - `default_port`: The port number to use when one wasn't specified
                           for a host in the URI.
     """
-    if not uri.startswith(SCHEME):
+    # removeprefix returns the original object untouched when the
+    # prefix doesn't match, so one identity check replaces a separate
+    # startswith scan plus slice.
+    scheme_free = uri.removeprefix(SCHEME)
+    if scheme_free is uri:
         raise InvalidURI("Invalid URI scheme: URI "
                          "must begin with '%s'" % (SCHEME,))
 
-    scheme_free = uri[SCHEME_LEN:]
-
     if not scheme_free:
         raise InvalidURI("Must provide at least one hostname or IP.")
 
+    # Fast path for the most common URI form, a bare host list with
+    # no auth, database or options.
+    if '/' not in scheme_free and '@' not in scheme_free:
+        if '?' in scheme_free:
+            raise InvalidURI("A '/' is required between "
+                             "the host list and any options.")
+        return {
+            'nodelist': split_hosts(scheme_free, default_port=default_port),
+            'username': None,
+            'password': None,
+            'database': None,
+            'collection': None,
+            'options': {}
+        }
+
     nodes = None
     user = None
     passwd = None
@@ -241,13 +239,13 @@ def parse_uri(uri, default_port=DEFAULT_PORT):
     collection = None
     options = {}
 
-    host_part, _, path_part = _partition(scheme_free, '/')
+    host_part, _, path_part = scheme_free.partition('/')
     if not path_part and '?' in host_part:
         raise InvalidURI("A '/' is required between "
                          "the host list and any options.")
 
     if '@' in host_part:
-        userinfo, _, hosts = _rpartition(host_part, '@')
+        userinfo, _, hosts = host_part.rpartition('@')
         user, passwd = parse_userinfo(userinfo)
     else:
         hosts = host_part
@@ -259,7 +257,7 @@ def parse_uri(uri, default_port=DEFAULT_PORT):
         if path_part[0] == '?':
             opts = path_part[1:]
         else:
-            dbase, _, opts = _partition(path_part, '?')
+            dbase, _, opts = path_part.partition('?')
             if '.' in dbase:
                 dbase, collection = dbase.split('.', 1)
 
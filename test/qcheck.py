@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import functools
 import random
 import traceback
 import datetime
@@ -30,71 +31,68 @@ reduction_attempts = 10
 examples = 5
 
 
-def lift(value):
-    return lambda: value
-
-
-def choose_lifted(generator_list):
-    return lambda: random.choice(generator_list)
+MAX_INT = 2147483647
+_PRINTABLE = "".join([chr(c) for c in range(32, 127)])
+_UNICHARS = "".join([chr(c) for c in range(1, 0x1000)])
+# "." and "$" aren't legal in mongo key names; strip them in one pass.
+_STRIP_TABLE = str.maketrans("", "", ".$")
 
 
-def map(generator, function):
-    return lambda: function(generator())
-
-
-def choose(list):
-    return lambda: random.choice(list)()
+def lift(value):
+    return lambda: value
 
 
 def gen_range(start, stop):
     return lambda: random.randint(start, stop)
 
 
+# The gen_* functions below generate a value per call rather than
+# returning a generator thunk; anything that needs a thunk can pass
+# the function itself.
+
 def gen_int():
-    max_int = 2147483647
-    return lambda: random.randint(-max_int - 1, max_int)
+    return random.randint(-MAX_INT - 1, MAX_INT)
 
 
 def gen_float():
-    return lambda: (random.random() - 0.5) * sys.maxsize
+    return (random.random() - 0.5) * sys.maxsize
 
 
 def gen_boolean():
-    return lambda: random.choice([True, False])
+    return random.choice([True, False])
 
 
 def gen_printable_char():
-    return lambda: chr(random.randint(32, 126))
+    return chr(random.randint(32, 126))
 
 
 def gen_printable_string(gen_length):
-    return lambda: "".join(gen_list(gen_printable_char(), gen_length)())
+    return lambda: "".join(random.choices(_PRINTABLE, k=gen_length()))
 
 
 def gen_char(set=None):
-    return lambda: chr(random.randint(0, 255))
+    return chr(random.randint(0, 255))
 
 
 def gen_byte(set=None):
-    return lambda: bytes([random.randint(0, 255)])
+    return bytes([random.randint(0, 255)])
 
 
 def gen_string(gen_length):
-    return lambda: "".join(gen_list(gen_char(), gen_length)())
+    return lambda: random.randbytes(gen_length()).decode("latin-1")
 
 
 def gen_bytes(gen_length):
-    return lambda: b"".join(gen_list(gen_byte(), gen_length)())
+    return lambda: random.randbytes(gen_length())
 
 
 def gen_unichar():
-    return lambda: chr(random.randint(1, 0xFFF))
+    return chr(random.randint(1, 0xFFF))
 
 
 def gen_unicode(gen_length):
-    return lambda: "".join([x for x in
-                             gen_list(gen_unichar(), gen_length)() if
-                             x not in ".$"])
+    return lambda: "".join(
+        random.choices(_UNICHARS, k=gen_length())).translate(_STRIP_TABLE)
 
 
 def gen_list(generator, gen_length):
@@ -102,13 +100,13 @@ def gen_list(generator, gen_length):
 
 
 def gen_datetime():
-    return lambda: datetime.datetime(random.randint(1970, 2037),
-                                     random.randint(1, 12),
-                                     random.randint(1, 28),
-                                     random.randint(0, 23),
-                                     random.randint(0, 59),
-                                     random.randint(0, 59),
-                                     random.randint(0, 999) * 1000)
+    return datetime.datetime(random.randint(1970, 2037),
+                             random.randint(1, 12),
+                             random.randint(1, 28),
+                             random.randint(0, 23),
+                             random.randint(0, 59),
+                             random.randint(0, 59),
+                             random.randint(0, 999) * 1000)
 
 
 def gen_dict(gen_key, gen_value, gen_length):
@@ -125,7 +123,7 @@ def gen_regexp(gen_length):
     # TODO our patterns only consist of one letter.
     # this is because of a bug in CPython's regex equality testing,
     # which I haven't quite tracked down, so I'm just ignoring it...
-    pattern = lambda: "".join(gen_list(choose_lifted("a"), gen_length)())
+    pattern = lambda: "a" * gen_length()
 
     def gen_flags():
         flags = 0
@@ -141,7 +139,7 @@ def gen_regexp(gen_length):
 
 
 def gen_objectid():
-    return lambda: ObjectId()
+    return ObjectId()
 
 
 def gen_dbref():
@@ -149,22 +147,28 @@ def gen_dbref():
     return lambda: DBRef(collection(), gen_mongo_value(1, True)())
 
 
-def gen_mongo_value(depth, ref):
+@functools.lru_cache(maxsize=None)
+def _mongo_value_choices(depth, ref):
     choices = [gen_unicode(gen_range(0, 50)),
                gen_printable_string(gen_range(0, 50)),
                gen_bytes(gen_range(0, 1000)),
-               gen_int(),
-               gen_float(),
-               gen_boolean(),
-               gen_datetime(),
-               gen_objectid(),
+               gen_int,
+               gen_float,
+               gen_boolean,
+               gen_datetime,
+               gen_objectid,
                lift(None)]
     if ref:
         choices.append(gen_dbref())
     if depth > 0:
         choices.append(gen_mongo_list(depth, ref))
         choices.append(gen_mongo_dict(depth, ref))
-    return choose(choices)
+    return tuple(choices)
+
+
+def gen_mongo_value(depth, ref):
+    choices = _mongo_value_choices(depth, ref)
+    return lambda: random.choice(choices)()
 
 
 def gen_mongo_list(depth, ref):
@@ -172,26 +176,26 @@ def gen_mongo_list(depth, ref):
 
 
 def gen_mongo_dict(depth, ref=True):
-    return map(gen_dict(gen_unicode(gen_range(0, 20)),
-                        gen_mongo_value(depth - 1, ref),
-                        gen_range(0, 10)), SON)
+    gen = gen_dict(gen_unicode(gen_range(0, 20)),
+                   gen_mongo_value(depth - 1, ref),
+                   gen_range(0, 10))
+    return lambda: SON(gen())
 
 
 def simplify(case):  # TODO this is a hack
     if isinstance(case, SON) and "$ref" not in case:
         simplified = SON(case)  # make a copy!
+        keys = tuple(simplified)
+        if not keys:
+            return (False, case)
+        key = random.choice(keys)
         if random.choice([True, False]):
             # delete
-            if not len(list(simplified.keys())):
-                return (False, case)
-            del simplified[random.choice(list(simplified.keys()))]
+            del simplified[key]
             return (True, simplified)
         else:
             # simplify a value
-            if not len(list(simplified.items())):
-                return (False, case)
-            (key, value) = random.choice(list(simplified.items()))
-            (success, value) = simplify(value)
+            (success, value) = simplify(simplified[key])
             simplified[key] = value
             return (success, success and simplified or case)
     if isinstance(case, list):
@@ -214,11 +218,15 @@ def simplify(case):  # TODO this is a hack
 
 
 def reduce(case, predicate, reductions=0):
-    for _ in range(reduction_attempts):
-        (reduced, simplified) = simplify(case)
-        if reduced and not predicate(simplified):
-            return reduce(simplified, predicate, reductions + 1)
-    return (reductions, case)
+    while True:
+        for _ in range(reduction_attempts):
+            (reduced, simplified) = simplify(case)
+            if reduced and not predicate(simplified):
+                case = simplified
+                reductions += 1
+                break
+        else:
+            return (reductions, case)
 
 
 def isnt(predicate):
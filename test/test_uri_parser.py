@@ -17,9 +17,7 @@
 import copy
 import unittest
 
-from pymongo.uri_parser import (_partition,
-                                _rpartition,
-                                parse_userinfo,
+from pymongo.uri_parser import (parse_userinfo,
                                 split_hosts,
                                 split_options,
                                 parse_uri)
@@ -30,14 +28,6 @@ from pymongo.errors import (ConfigurationError,
 
 class TestURI(unittest.TestCase):
 
-    def test_partition(self):
-        self.assertEqual(('foo', ':', 'bar'), _partition('foo:bar', ':'))
-        self.assertEqual(('foobar', '', ''), _partition('foobar', ':'))
-
-    def test_rpartition(self):
-        self.assertEqual(('fo:o:', ':', 'bar'), _rpartition('fo:o::bar', ':'))
-        self.assertEqual(('', '', 'foobar'), _rpartition('foobar', ':'))
-
     def test_validate_userinfo(self):
         self.assertRaises(InvalidURI, parse_userinfo,
                           'foo@')